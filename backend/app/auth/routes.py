@@ -8,6 +8,7 @@ from sqlmodel import Session, select
 from datetime import timedelta
 from app.core.redis import redis_client as redis
 from app.core.config import settings
+from app.core.rate_limit import enforce_rate_limit
 from jose import jwt
 router = APIRouter(prefix="/auth", tags=["Auth"])
 
@@ -15,7 +16,21 @@ REFRESH_COOKIE_NAME = "refresh_token"
 
 # Login route
 @router.post("/login", response_model=Token)
-def login(response: Response, data: LoginRequest, db: Session = Depends(get_db)):
+def login(request: Request, response: Response, data: LoginRequest, db: Session = Depends(get_db)):
+    client_ip = request.client.host if request.client else "unknown"
+    enforce_rate_limit(
+        f"login:ip:{client_ip}",
+        settings.LOGIN_RATE_LIMIT_IP_BURST,
+        settings.LOGIN_RATE_LIMIT_IP_PER_MINUTE,
+        "login",
+    )
+    enforce_rate_limit(
+        f"login:user:{data.email.lower()}",
+        settings.LOGIN_RATE_LIMIT_USER_BURST,
+        settings.LOGIN_RATE_LIMIT_USER_PER_MINUTE,
+        "login",
+    )
+
     user = db.exec(select(User).where(User.email == data.email)).first()
 
     if not user or not verify_password(data.password, user.passwordHash):
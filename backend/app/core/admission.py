@@ -0,0 +1,149 @@
+import asyncio
+import re
+import time
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Optional
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.metrics import record_shed
+
+
+class Priority(IntEnum):
+    HEALTH = 0
+    CRITICAL = 1
+    NORMAL = 2
+    LOW = 3
+
+
+# Fraction of the global slots each priority may fill, and how long it may queue for one.
+# Only HEALTH may use the last 10%, so a burst of case creation can't starve probes.
+PRIORITY_SHARE = {Priority.HEALTH: 1.0, Priority.CRITICAL: 0.9, Priority.NORMAL: 0.8, Priority.LOW: 0.6}
+PRIORITY_QUEUE_BUDGET = {Priority.HEALTH: 5.0, Priority.CRITICAL: 5.0, Priority.NORMAL: 1.0, Priority.LOW: 0.25}
+
+
+@dataclass(frozen=True)
+class RoutePolicy:
+    name: str
+    priority: Priority
+    max_concurrency: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class RouteRule:
+    method: str
+    pattern: re.Pattern
+    policy: RoutePolicy
+
+
+DEFAULT_POLICY = RoutePolicy("default", Priority.NORMAL)
+
+
+class _Slots:
+    def __init__(self, capacity: int) -> None:
+        self.capacity = capacity
+        self.in_use = 0
+        self._cond = asyncio.Condition()
+
+    async def acquire(self, limit: int, timeout: float) -> bool:
+        async with self._cond:
+            if self.in_use < limit:
+                self.in_use += 1
+                return True
+            if timeout <= 0:
+                return False
+            try:
+                await asyncio.wait_for(self._cond.wait_for(lambda: self.in_use < limit), timeout)
+            except asyncio.TimeoutError:
+                return False
+            self.in_use += 1
+            return True
+
+    async def release(self) -> None:
+        async with self._cond:
+            self.in_use -= 1
+            self._cond.notify_all()
+
+
+class AdmissionControlMiddleware:
+    """Caps in-flight requests and sheds load with a fast 503 instead of queueing.
+
+    Every request outside exempt_paths takes a global slot; lower priorities may
+    only fill part of the pool so health checks and case creation still get
+    through while list polling is being shed. Rules can also cap concurrency for
+    a single route; that slot is taken first, and both waits share the
+    priority's queue budget.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        rules: list[RouteRule],
+        max_concurrency: int = 40,
+        retry_after: int = 1,
+        exempt_paths: tuple[str, ...] = (),
+    ) -> None:
+        self.app = app
+        self.rules = rules
+        self.exempt_paths = frozenset(exempt_paths)
+        self.retry_after = retry_after
+        self._global = _Slots(max_concurrency)
+        self._per_route = {
+            rule.policy.name: _Slots(rule.policy.max_concurrency)
+            for rule in rules
+            if rule.policy.max_concurrency
+        }
+
+    def _policy_for(self, method: str, path: str) -> RoutePolicy:
+        for rule in self.rules:
+            if rule.method == method and rule.pattern.fullmatch(path):
+                return rule.policy
+        return DEFAULT_POLICY
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in self.exempt_paths:
+            await self.app(scope, receive, send)
+            return
+
+        policy = self._policy_for(scope["method"], scope["path"])
+        deadline = time.monotonic() + PRIORITY_QUEUE_BUDGET[policy.priority]
+        global_limit = int(self._global.capacity * PRIORITY_SHARE[policy.priority])
+        if policy.priority != Priority.HEALTH:
+            # Always hold back at least one slot for health checks
+            global_limit = min(global_limit, self._global.capacity - 1)
+        global_limit = max(1, global_limit)
+
+        # Queue for the route's own slot first so requests waiting on a capped
+        # route don't sit on global capacity that other classes need
+        route_slots = self._per_route.get(policy.name)
+        if route_slots and not await route_slots.acquire(route_slots.capacity, deadline - time.monotonic()):
+            await self._shed("route_limit", policy, scope, receive, send)
+            return
+
+        if not await self._global.acquire(global_limit, deadline - time.monotonic()):
+            if route_slots:
+                await route_slots.release()
+            await self._shed("overloaded", policy, scope, receive, send)
+            return
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            if route_slots:
+                await route_slots.release()
+            await self._global.release()
+
+    async def _shed(self, reason: str, policy: RoutePolicy, scope: Scope, receive: Receive, send: Send) -> None:
+        record_shed(reason, policy.name)
+        response = JSONResponse(
+            {"detail": "Server is busy, please retry shortly"},
+            status_code=503,
+            headers={"Retry-After": str(self.retry_after)},
+        )
+        await response(scope, receive, send)
+
+
+def route(method: str, path_regex: str, policy: RoutePolicy) -> RouteRule:
+    return RouteRule(method, re.compile(path_regex), policy)
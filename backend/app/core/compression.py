@@ -0,0 +1,160 @@
+import gzip
+import json
+from typing import Callable, Optional
+
+import anyio
+import brotli
+import msgpack
+import zstandard
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+MSGPACK_MEDIA_TYPES = ("application/msgpack", "application/x-msgpack")
+
+# Responses that must go out exactly as the app produced them
+NO_BODY_STATUSES = (204, 304)
+
+# Levels tuned for dynamic responses: most of the ratio for a fraction of the CPU
+_zstd_compressor = zstandard.ZstdCompressor(level=3)
+
+ENCODERS: dict[str, Callable[[bytes], bytes]] = {
+    "zstd": _zstd_compressor.compress,
+    "br": lambda body: brotli.compress(body, quality=4),
+    "gzip": lambda body: gzip.compress(body, compresslevel=6),
+}
+
+
+def _parse_weights(header: str) -> dict[str, float]:
+    """Map each token or media range in an Accept-style header to its q-value"""
+    weights: dict[str, float] = {}
+    for part in header.split(","):
+        name, *params = part.split(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        q = 1.0
+        for param in params:
+            key, _, value = param.strip().partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        weights[name] = q
+    return weights
+
+
+def negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    """Pick the best supported content-coding from an Accept-Encoding header.
+
+    Highest q-value wins; ties fall back to the server preference order of ENCODERS.
+    """
+    weights = _parse_weights(accept_encoding)
+    wildcard = weights.get("*", 0.0)
+    best, best_q = None, 0.0
+    for name in ENCODERS:
+        q = weights.get(name, wildcard)
+        if q > best_q:
+            best, best_q = name, q
+    return best
+
+
+def wants_msgpack(accept: str) -> bool:
+    """True when the client explicitly ranks MessagePack at least as high as JSON.
+
+    Wildcards never select MessagePack, so browsers sending */* keep getting JSON.
+    """
+    weights = _parse_weights(accept)
+    msgpack_q = max(weights.get(media_type, 0.0) for media_type in MSGPACK_MEDIA_TYPES)
+    json_q = weights.get(
+        "application/json",
+        weights.get("application/*", weights.get("*/*", 0.0)),
+    )
+    return msgpack_q > 0 and msgpack_q >= json_q
+
+
+class ResponseEncodingMiddleware:
+    """Negotiates MessagePack bodies and gzip/brotli/zstd compression.
+
+    Bodies smaller than minimum_size go out uncompressed, and anything at or
+    above offload_size is encoded in a worker thread to keep the event loop free.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024, offload_size: int = 65536) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.offload_size = offload_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] == "HEAD":
+            await self.app(scope, receive, send)
+            return
+
+        request_headers = Headers(scope=scope)
+        encoding = negotiate_encoding(request_headers.get("accept-encoding", ""))
+        use_msgpack = wants_msgpack(request_headers.get("accept", ""))
+        if not encoding and not use_msgpack:
+            await self.app(scope, receive, send)
+            return
+
+        start_message: Optional[Message] = None
+        passthrough = False
+        chunks: list[bytes] = []
+
+        async def buffered_send(message: Message) -> None:
+            nonlocal start_message, passthrough
+            if message["type"] == "http.response.start":
+                if message["status"] in NO_BODY_STATUSES:
+                    passthrough = True
+                    await send(message)
+                else:
+                    start_message = message
+                return
+            if passthrough or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            chunks.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+
+            original = b"".join(chunks)
+            headers = MutableHeaders(raw=start_message["headers"])
+            body = await self._encode(original, headers, encoding, use_msgpack)
+            if body is not original:
+                headers["content-length"] = str(len(body))
+            headers.add_vary_header("Accept-Encoding")
+            headers.add_vary_header("Accept")
+            await send(start_message)
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, buffered_send)
+
+    async def _encode(
+        self,
+        body: bytes,
+        headers: MutableHeaders,
+        encoding: Optional[str],
+        use_msgpack: bool,
+    ) -> bytes:
+        offload = len(body) >= self.offload_size
+
+        if use_msgpack and body and headers.get("content-type", "").startswith("application/json"):
+            body = await self._run(_json_to_msgpack, body, offload)
+            headers["content-type"] = MSGPACK_MEDIA_TYPES[0]
+
+        if encoding and len(body) >= self.minimum_size and "content-encoding" not in headers:
+            body = await self._run(ENCODERS[encoding], body, offload)
+            headers["content-encoding"] = encoding
+
+        return body
+
+    @staticmethod
+    async def _run(func: Callable[[bytes], bytes], body: bytes, offload: bool) -> bytes:
+        if offload:
+            return await anyio.to_thread.run_sync(func, body)
+        return func(body)
+
+
+def _json_to_msgpack(body: bytes) -> bytes:
+    return msgpack.packb(json.loads(body))
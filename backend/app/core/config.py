@@ -8,14 +8,42 @@ class Settings(BaseSettings):
     COOKIE_SECURE: bool = True
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     ALLOWED_ORIGINS: list = ["http://localhost:5173"]
+    COMPRESSION_MINIMUM_SIZE: int = 1024
+    COMPRESSION_OFFLOAD_SIZE: int = 65536
+    
+    ADMISSION_MAX_CONCURRENCY: int = 40
+    ADMISSION_LIST_CONCURRENCY: int = 8
+    ADMISSION_LOGIN_CONCURRENCY: int = 8
+    ADMISSION_RETRY_AFTER_SECONDS: int = 1
+    METRICS_TOKEN: str = ""
+    LOGIN_RATE_LIMIT_IP_BURST: int = 20
+    LOGIN_RATE_LIMIT_IP_PER_MINUTE: int = 20
+    LOGIN_RATE_LIMIT_USER_BURST: int = 5
+    LOGIN_RATE_LIMIT_USER_PER_MINUTE: int = 5
     
     REDIS_URL: str
+    REDIS_POOL_WARM_SIZE: int = 5
+    IDEMPOTENCY_TTL_SECONDS: int = 86400
+    IDEMPOTENCY_LOCK_SECONDS: int = 30
+    IDEMPOTENCY_WAIT_SECONDS: float = 1.0
+    IDEMPOTENCY_POLL_SECONDS: float = 0.05
     
     DB_USER: str
     DB_PW: str
     DB_HOST: str
     DB_PORT: str = "5432"
     DB_NAME: str
+    # Pool sizes, admission limits and metrics are per worker process; the
+    # totals multiply by the worker count chosen in app/server.py
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    # Postgres connections all workers together may use (server default max_connections is 100)
+    DB_MAX_CONNECTIONS: int = 80
+    
+    WEB_CONCURRENCY: int = 0
+    GRACEFUL_SHUTDOWN_SECONDS: int = 30
+    HEALTH_CACHE_SECONDS: float = 2.0
+    HEALTH_CHECK_TIMEOUT_SECONDS: int = 2
     
     @property
     def SQLALCHEMY_DATABASE_URL(self) -> str:
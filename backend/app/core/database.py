@@ -1,4 +1,20 @@
-from sqlmodel import create_engine
+from sqlmodel import create_engine, text
 from app.core.config import settings
 
-engine = create_engine(str(settings.SQLALCHEMY_DATABASE_URL))
\ No newline at end of file
+engine = create_engine(
+    str(settings.SQLALCHEMY_DATABASE_URL),
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+)
+
+def warm_pool() -> None:
+    """Open pool_size connections up front so the first requests don't pay for the handshake"""
+    connections = []
+    try:
+        for _ in range(settings.DB_POOL_SIZE):
+            connection = engine.connect()
+            connections.append(connection)
+            connection.execute(text("SELECT 1"))
+    finally:
+        for connection in connections:
+            connection.close()
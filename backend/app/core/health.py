@@ -0,0 +1,94 @@
+import logging
+import threading
+import time
+from typing import Optional
+
+import redis
+from sqlalchemy.pool import NullPool
+from sqlmodel import create_engine, text
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Probes use their own short-timeout connections so a saturated app pool or a
+# stalled backend can't hold a readiness check for the full pool_timeout
+_probe_engine = create_engine(
+    str(settings.SQLALCHEMY_DATABASE_URL),
+    poolclass=NullPool,
+    connect_args={"connect_timeout": settings.HEALTH_CHECK_TIMEOUT_SECONDS},
+)
+_probe_redis = redis.Redis.from_url(
+    settings.REDIS_URL,
+    socket_timeout=settings.HEALTH_CHECK_TIMEOUT_SECONDS,
+    socket_connect_timeout=settings.HEALTH_CHECK_TIMEOUT_SECONDS,
+)
+
+
+class ReadinessCheck:
+    """Checks the database and Redis, reusing the last result for ttl seconds.
+
+    Probes hit this every few seconds per replica, so only one caller at a time
+    actually talks to the backends; the rest get the previous result. Only
+    changes in readiness are logged.
+    """
+
+    def __init__(self, ttl: float) -> None:
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._result: Optional[dict] = None
+        self._checked_at = 0.0
+
+    def cached(self) -> Optional[dict]:
+        """The last result if it is still fresh, without touching any backend"""
+        if self._result and time.monotonic() - self._checked_at < self.ttl:
+            return self._result
+        return None
+
+    def run(self, force: bool = False) -> dict:
+        if not force and (result := self.cached()):
+            return result
+
+        # Someone else is already checking: hand back the stale result rather than queue
+        if not self._lock.acquire(blocking=self._result is None):
+            return self._result
+        try:
+            if not force and (result := self.cached()):
+                return result
+            result = self._check()
+            if self._result is None or self._result["status"] != result["status"]:
+                log = logger.info if result["status"] == "healthy" else logger.warning
+                log(f"Readiness changed to {result['status']}: {result}")
+
+            self._result = result
+            self._checked_at = time.monotonic()
+            return result
+        finally:
+            self._lock.release()
+
+    @staticmethod
+    def _check() -> dict:
+        result = {"status": "healthy", "database": "connected", "redis": "connected"}
+        errors = {}
+
+        try:
+            with _probe_engine.connect() as connection:
+                connection.execute(text("SELECT 1"))
+        except Exception as e:
+            result["database"] = "disconnected"
+            errors["database"] = str(e)
+
+        try:
+            _probe_redis.ping()
+        except Exception as e:
+            result["redis"] = "disconnected"
+            errors["redis"] = str(e)
+
+        if errors:
+            result["status"] = "unhealthy"
+            result["errors"] = errors
+        return result
+
+
+def close_probes() -> None:
+    _probe_redis.close()
+    _probe_engine.dispose()
@@ -0,0 +1,115 @@
+import hashlib
+import json
+import logging
+import time
+import uuid
+from typing import Any, Callable, Optional
+
+from fastapi import HTTPException, Response
+from redis.exceptions import RedisError
+from sqlmodel import SQLModel
+from app.core.config import settings
+from app.core.redis import redis_client as redis
+
+logger = logging.getLogger(__name__)
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+MAX_KEY_LENGTH = 255
+
+# Only delete the in-flight marker if this worker still owns it
+_release_script = redis.register_script("""
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+""")
+
+
+def fingerprint(payload: SQLModel) -> str:
+    return hashlib.sha256(payload.model_dump_json().encode()).hexdigest()
+
+
+def run_idempotent(
+    key: Optional[str],
+    scope: str,
+    request_fingerprint: str,
+    response: Response,
+    work: Callable[[], SQLModel],
+) -> Any:
+    """Run work() at most once per Idempotency-Key and replay its stored response.
+
+    The first request claims the key with SET NX and stores the result when done.
+    Concurrent retries poll briefly for that result and otherwise get a 409 to
+    retry later, so waiting never pins a threadpool worker for long. If Redis is
+    unavailable the work runs unguarded rather than blocking case intake.
+    """
+    if key is None:
+        return work()
+    if not key or len(key) > MAX_KEY_LENGTH:
+        raise HTTPException(status_code=400, detail=f"{IDEMPOTENCY_HEADER} must be 1-{MAX_KEY_LENGTH} characters")
+
+    redis_key = f"idempotency:{scope}:{key}"
+    in_flight = json.dumps({"state": "processing", "token": uuid.uuid4().hex, "fingerprint": request_fingerprint})
+
+    try:
+        stored_body = _claim_or_wait(redis_key, in_flight, request_fingerprint)
+    except RedisError as e:
+        logger.warning(f"Idempotency check for {redis_key} skipped: {e}")
+        return work()
+
+    if stored_body is not None:
+        logger.info(f"Replaying stored response for {redis_key}")
+        response.headers["Idempotent-Replayed"] = "true"
+        return stored_body
+
+    try:
+        result = work()
+    except Exception:
+        try:
+            _release_script(keys=[redis_key], args=[in_flight])
+        except RedisError as e:
+            logger.warning(f"Could not release {redis_key}: {e}")
+        raise
+
+    # The work has committed by now, so a failed store must not fail the request
+    try:
+        redis.set(
+            redis_key,
+            json.dumps({
+                "state": "done",
+                "fingerprint": request_fingerprint,
+                "body": result.model_dump(mode="json"),
+            }),
+            ex=settings.IDEMPOTENCY_TTL_SECONDS,
+        )
+    except RedisError as e:
+        logger.error(f"Could not store idempotent response for {redis_key}: {e}")
+    return result
+
+
+def _claim_or_wait(redis_key: str, in_flight: str, request_fingerprint: str) -> Optional[dict]:
+    """Claim the key (returns None) or return the body stored by an earlier request."""
+    deadline = time.monotonic() + settings.IDEMPOTENCY_WAIT_SECONDS
+
+    while True:
+        if redis.set(redis_key, in_flight, nx=True, ex=settings.IDEMPOTENCY_LOCK_SECONDS):
+            return None
+
+        stored = redis.get(redis_key)
+        if stored is not None:
+            record = json.loads(stored)
+            if record["fingerprint"] != request_fingerprint:
+                raise HTTPException(
+                    status_code=422,
+                    detail=f"{IDEMPOTENCY_HEADER} was already used with a different request",
+                )
+            if record["state"] == "done":
+                return record["body"]
+
+        if time.monotonic() >= deadline:
+            raise HTTPException(
+                status_code=409,
+                detail="A request with this Idempotency-Key is still in progress",
+                headers={"Retry-After": "1"},
+            )
+        time.sleep(settings.IDEMPOTENCY_POLL_SECONDS)
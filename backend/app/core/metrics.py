@@ -0,0 +1,45 @@
+import os
+import threading
+from collections import Counter
+
+_lock = threading.Lock()
+_shed_requests: Counter = Counter()
+_startup_seconds: dict[str, float] = {}
+
+
+def record_shed(reason: str, route_class: str) -> None:
+    with _lock:
+        _shed_requests[(reason, route_class)] += 1
+
+
+def record_startup(phase: str, seconds: float) -> None:
+    with _lock:
+        _startup_seconds[phase] = seconds
+
+
+def render_metrics() -> str:
+    """Prometheus text exposition of the counters kept by this process.
+
+    Each uvicorn worker keeps its own counters and a scrape reaches whichever
+    worker accepts it, so every sample carries a pid label; aggregate with
+    sum without (pid) (...) on the Prometheus side.
+    """
+    pid = os.getpid()
+    with _lock:
+        samples = sorted(_shed_requests.items())
+        startup = sorted(_startup_seconds.items())
+
+    lines = [
+        "# HELP requests_shed_total Requests rejected by admission control or rate limiting.",
+        "# TYPE requests_shed_total counter",
+    ]
+    for (reason, route_class), count in samples:
+        lines.append(f'requests_shed_total{{reason="{reason}",route_class="{route_class}",pid="{pid}"}} {count}')
+
+    lines += [
+        "# HELP app_startup_seconds Time spent in each cold-start phase of this worker.",
+        "# TYPE app_startup_seconds gauge",
+    ]
+    for phase, seconds in startup:
+        lines.append(f'app_startup_seconds{{phase="{phase}",pid="{pid}"}} {seconds:.6f}')
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,58 @@
+import logging
+
+from fastapi import HTTPException
+from redis.exceptions import RedisError
+from app.core.metrics import record_shed
+from app.core.redis import redis_client as redis
+
+logger = logging.getLogger(__name__)
+
+# Token bucket: refill by elapsed time, take one token if available.
+# Returns {allowed, seconds until the next token}.
+_token_bucket_script = redis.register_script("""
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local now = redis.call('TIME')
+now = tonumber(now[1]) + tonumber(now[2]) / 1000000
+
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(bucket[1]) or capacity
+local ts = tonumber(bucket[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+
+local allowed = 0
+local retry_after = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+else
+    retry_after = math.ceil((1 - tokens) / rate)
+end
+
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 1)
+return {allowed, retry_after}
+""")
+
+
+def enforce_rate_limit(bucket: str, capacity: int, per_minute: int, route_class: str) -> None:
+    """Take one token from the named bucket or raise 429 with Retry-After.
+
+    Fails open if Redis is unavailable so an outage doesn't lock everyone out.
+    """
+    try:
+        allowed, retry_after = _token_bucket_script(
+            keys=[f"rate_limit:{bucket}"],
+            args=[capacity, per_minute / 60],
+        )
+    except RedisError as e:
+        logger.warning(f"Rate limit check for {bucket} skipped: {e}")
+        return
+
+    if not allowed:
+        record_shed("rate_limited", route_class)
+        raise HTTPException(
+            status_code=429,
+            detail="Too many requests, please retry later",
+            headers={"Retry-After": str(max(1, int(retry_after)))},
+        )
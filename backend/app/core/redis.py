@@ -2,3 +2,17 @@ import redis
 from app.core.config import settings
 
 redis_client = redis.Redis.from_url(settings.REDIS_URL)
+
+def warm_pool() -> None:
+    """Open and PING REDIS_POOL_WARM_SIZE pooled connections before traffic arrives"""
+    pool = redis_client.connection_pool
+    connections = []
+    try:
+        for _ in range(settings.REDIS_POOL_WARM_SIZE):
+            connection = pool.get_connection()
+            connections.append(connection)
+            connection.send_command("PING")
+            connection.read_response()
+    finally:
+        for connection in connections:
+            pool.release(connection)
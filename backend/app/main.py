@@ -1,14 +1,24 @@
 # app/main.py
+import time
+_import_started = time.perf_counter()
+
+import hmac
 import logging
-from fastapi import FastAPI, Depends
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
-from sqlmodel import Session, text
 from app.auth.routes import router as auth_routes
 from app.routes.triageCase import router as triage_routes
 from app.routes.user import router as user_routes
-from app.core.database import engine
+from app.core.database import engine, warm_pool as warm_db_pool
+from app.core.redis import redis_client, warm_pool as warm_redis_pool
 from app.core.config import settings
-from app.core.dependencies import get_db
+from app.core.compression import ResponseEncodingMiddleware
+from app.core.admission import AdmissionControlMiddleware, Priority, RoutePolicy, route
+from app.core.metrics import record_startup, render_metrics
+from app.core.health import ReadinessCheck, close_probes
 
 logging.basicConfig(
     level=logging.DEBUG,
@@ -19,8 +29,54 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-app = FastAPI()
+readiness = ReadinessCheck(ttl=settings.HEALTH_CACHE_SECONDS)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    import_seconds = time.perf_counter() - _import_started
+    warmup_started = time.perf_counter()
+    # Keep serving if a backend is down; readiness reports unhealthy until it comes up
+    try:
+        await run_in_threadpool(warm_db_pool)
+    except Exception as e:
+        logger.error(f"Database pool warm-up failed: {e}")
+    try:
+        await run_in_threadpool(warm_redis_pool)
+    except Exception as e:
+        logger.error(f"Redis pool warm-up failed: {e}")
+    await run_in_threadpool(readiness.run, True)
+    warmup_seconds = time.perf_counter() - warmup_started
+
+    record_startup("import", import_seconds)
+    record_startup("warmup", warmup_seconds)
+    logger.info(
+        f"Startup complete in {(import_seconds + warmup_seconds) * 1000:.0f} ms "
+        f"(import {import_seconds * 1000:.0f} ms, pool warm-up {warmup_seconds * 1000:.0f} ms)"
+    )
+    yield
+    close_probes()
+    redis_client.close()
+    engine.dispose()
+
+app = FastAPI(lifespan=lifespan)
 
+LIST_POLLING = RoutePolicy("list_cases", Priority.LOW, settings.ADMISSION_LIST_CONCURRENCY)
+
+# Added first so it sits inside CORS and shed 503s still carry CORS headers
+app.add_middleware(
+    AdmissionControlMiddleware,
+    rules=[
+        route("GET", r"/health(/ready)?", RoutePolicy("health", Priority.HEALTH)),
+        route("POST", r"/triage-cases/?", RoutePolicy("create_case", Priority.CRITICAL)),
+        route("GET", r"/triage-cases/?", LIST_POLLING),
+        route("GET", r"/triage-cases/status/[^/]+", LIST_POLLING),
+        route("POST", r"/auth/login", RoutePolicy("login", Priority.NORMAL, settings.ADMISSION_LOGIN_CONCURRENCY)),
+    ],
+    max_concurrency=settings.ADMISSION_MAX_CONCURRENCY,
+    retry_after=settings.ADMISSION_RETRY_AFTER_SECONDS,
+    # Liveness never touches a backend, so it must answer even when every slot is taken
+    exempt_paths=("/health/live",),
+)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.ALLOWED_ORIGINS,
@@ -28,6 +84,11 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(
+    ResponseEncodingMiddleware,
+    minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+    offload_size=settings.COMPRESSION_OFFLOAD_SIZE,
+)
 
 app.include_router(auth_routes)
 app.include_router(triage_routes)
@@ -37,12 +98,31 @@ app.include_router(user_routes)
 def root():
     return {"message": "FastAPI + PostgreSQL Backend Running"}
 
+@app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def metrics(request: Request):
+    # Disabled unless METRICS_TOKEN is set; scrapers send it as a bearer token
+    expected = f"Bearer {settings.METRICS_TOKEN}"
+    provided = request.headers.get("authorization", "")
+    if not settings.METRICS_TOKEN or not hmac.compare_digest(provided.encode(), expected.encode()):
+        raise HTTPException(status_code=404, detail="Not Found")
+    return render_metrics()
+
+async def current_readiness() -> dict:
+    # Fresh results are served straight from the event loop; only a real check
+    # goes to the threadpool
+    return readiness.cached() or await run_in_threadpool(readiness.run)
+
 @app.get("/health")
-def health_check(db: Session = Depends(get_db)):
-    try:
-        db.exec(text("SELECT 1"))
-        logger.info("Health check: database connected")
-        return {"status": "healthy", "database": "connected"}
-    except Exception as e:
-        logger.error(f"Health check failed: {e}")
-        return {"status": "unhealthy", "database": "disconnected", "error": str(e)}
\ No newline at end of file
+async def health_check():
+    return await current_readiness()
+
+@app.get("/health/live")
+async def liveness_check():
+    return {"status": "alive"}
+
+@app.get("/health/ready")
+async def readiness_check(response: Response):
+    result = await current_readiness()
+    if result["status"] != "healthy":
+        response.status_code = 503
+    return result
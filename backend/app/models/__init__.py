@@ -11,4 +11,6 @@ from .models import (
   TriageCaseResolve,
   TriageCasePublic,
   TriageCasesPublic,
+  TriageCaseBatchRequest,
+  TriageCasesBatchPublic,
 )
\ No newline at end of file
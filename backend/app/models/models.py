@@ -141,4 +141,13 @@ class TriageCasePublic(TriageCaseBase, PatientBase):
 
 class TriageCasesPublic(SQLModel):
     cases: list[TriageCasePublic] 
-    count: int
\ No newline at end of file
+    count: int
+
+MAX_BATCH_CASE_IDS = 500
+
+class TriageCaseBatchRequest(SQLModel):
+    caseIDs: list[uuid.UUID] = Field(min_length=1, max_length=MAX_BATCH_CASE_IDS)
+
+class TriageCasesBatchPublic(SQLModel):
+    cases: list[TriageCasePublic]
+    missing: list[uuid.UUID]
\ No newline at end of file
@@ -1,16 +1,19 @@
 import uuid
 import logging
-from typing import Any
+from typing import Any, Optional
 from datetime import datetime
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Header, Response
 from sqlmodel import Session, func, select
 from app.core.dependencies import get_db
+from app.core.idempotency import IDEMPOTENCY_HEADER, fingerprint, run_idempotent
 from app.auth.dependencies import get_current_user
 from app.models import (
     TriageCase,
     TriageCaseCreate,
     TriageCasePublic,
     TriageCasesPublic,
+    TriageCaseBatchRequest,
+    TriageCasesBatchPublic,
     TriageCaseUpdate,
     TriageCaseResolve,
     Message,
@@ -21,17 +24,11 @@ from app.models import (
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/triage-cases", tags=["triage-cases"])
 
-def build_case_public(case: TriageCase, db: Session) -> TriageCasePublic:
-    patient = db.get(Patient, case.patientID)
-    if not patient:
-        raise HTTPException(status_code=404, detail="Patient not found")
-    
-    resolved_by_email = None
-    if case.resolvedBy:
-        resolver = db.get(User, case.resolvedBy)
-        if resolver:
-            resolved_by_email = resolver.email
-            
+def to_case_public(
+    case: TriageCase,
+    patient: Patient,
+    resolver_email: Optional[str]
+) -> TriageCasePublic:
     return TriageCasePublic(
         **case.model_dump(),
         firstName=patient.firstName,
@@ -42,9 +39,22 @@ def build_case_public(case: TriageCase, db: Session) -> TriageCasePublic:
         returningPatient=patient.returningPatient,
         languagePreference=patient.languagePreference,
         verified=patient.verified,
-        resolvedByEmail=resolved_by_email
+        resolvedByEmail=resolver_email,
     )
 
+def build_case_public(case: TriageCase, db: Session) -> TriageCasePublic:
+    patient = db.get(Patient, case.patientID)
+    if not patient:
+        raise HTTPException(status_code=404, detail="Patient not found")
+    
+    resolved_by_email = None
+    if case.resolvedBy:
+        resolver = db.get(User, case.resolvedBy)
+        if resolver:
+            resolved_by_email = resolver.email
+            
+    return to_case_public(case, patient, resolved_by_email)
+
 def update_patient_info(
     patient: Patient,
     patient_updates: dict,
@@ -77,18 +87,7 @@ def get_all_cases(
     results = db.exec(statement).all()
     
     cases_public = [
-        TriageCasePublic(
-            **case.model_dump(),
-            firstName=patient.firstName,
-            lastName=patient.lastName,
-            DOB=patient.DOB,
-            contactInfo=patient.contactInfo,
-            insuranceInfo=patient.insuranceInfo,
-            returningPatient=patient.returningPatient,
-            languagePreference=patient.languagePreference,
-            verified=patient.verified,
-            resolvedByEmail=resolver_email,
-        )
+        to_case_public(case, patient, resolver_email)
         for case, patient, resolver_email in results
     ]
 
@@ -121,23 +120,43 @@ def get_cases_by_status(
     results = db.exec(statement).all()
     
     cases_public = [
-        TriageCasePublic(
-            **case.model_dump(),
-            firstName=patient.firstName,
-            lastName=patient.lastName,
-            DOB=patient.DOB,
-            contactInfo=patient.contactInfo,
-            insuranceInfo=patient.insuranceInfo,
-            returningPatient=patient.returningPatient,
-            languagePreference=patient.languagePreference,
-            verified=patient.verified,
-            resolvedByEmail=resolver_email,
-        )
+        to_case_public(case, patient, resolver_email)
         for case, patient, resolver_email in results
     ]
 
     return TriageCasesPublic(cases=cases_public, count=count)
 
+@router.post("/batch", response_model=TriageCasesBatchPublic)
+def get_cases_by_ids(
+    batch: TriageCaseBatchRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+) -> Any:
+    logger.info(f"POST /triage-cases/batch - {len(batch.caseIDs)} ids, user: {current_user.email}")
+
+    # Dedupe while keeping the caller's order so the IN list stays small
+    requested_ids = list(dict.fromkeys(batch.caseIDs))
+
+    statement = (
+        select(TriageCase, Patient, User.email)
+        .join(Patient)
+        .outerjoin(User, TriageCase.resolvedBy == User.userID)
+        .where(TriageCase.caseID.in_(requested_ids))
+    )
+    results = db.exec(statement).all()
+
+    cases_by_id = {
+        case.caseID: to_case_public(case, patient, resolver_email)
+        for case, patient, resolver_email in results
+    }
+
+    cases_public = [cases_by_id[case_id] for case_id in requested_ids if case_id in cases_by_id]
+    missing = [case_id for case_id in requested_ids if case_id not in cases_by_id]
+
+    if missing:
+        logger.warning(f"POST /triage-cases/batch - {len(missing)} case(s) not found")
+    return TriageCasesBatchPublic(cases=cases_public, missing=missing)
+
 @router.get("/{id}", response_model=TriageCasePublic)
 def get_specific_case(
     id: uuid.UUID,
@@ -156,18 +175,29 @@ def get_specific_case(
 @router.post("/", response_model=TriageCasePublic)
 def create_new_case(
     new_case: TriageCaseCreate,
+    response: Response,
     db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user)
+    current_user: dict = Depends(get_current_user),
+    idempotency_key: Optional[str] = Header(default=None, alias=IDEMPOTENCY_HEADER)
 ) -> Any:
     logger.info(f"POST /triage-cases/ - user: {current_user.email}, body: {new_case.model_dump()}")
     
-    case = TriageCase.model_validate(new_case)
+    def create() -> TriageCasePublic:
+        case = TriageCase.model_validate(new_case)
 
-    db.add(case)
-    db.commit()
-    db.refresh(case)
-    
-    return build_case_public(case, db)
+        db.add(case)
+        db.commit()
+        db.refresh(case)
+        
+        return build_case_public(case, db)
+
+    return run_idempotent(
+        idempotency_key,
+        f"create-case:{current_user.userID}",
+        fingerprint(new_case),
+        response,
+        create,
+    )
 
 @router.put("/{id}", response_model=TriageCasePublic)
 def update_case(
@@ -236,28 +266,39 @@ def delete_case(
 def resolve_case(
     id: uuid.UUID,
     update: TriageCaseResolve,
+    response: Response,
     db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user)
+    current_user: dict = Depends(get_current_user),
+    idempotency_key: Optional[str] = Header(default=None, alias=IDEMPOTENCY_HEADER)
 ) -> Any:
     logger.info(f"PATCH /triage-cases/{id}/resolve - user: {current_user.email}, body: {update.model_dump()}")
     
     if not update.resolutionReason or not update.resolutionReason.strip():
         raise HTTPException(status_code=400, detail="Resolution reason is required and cannot be empty")
     
-    case = db.get(TriageCase, id)
-    if not case:
-        raise HTTPException(status_code=404, detail="Triage case not found")
-    
-    if case.status == "resolved":
-      raise HTTPException(status_code=400, detail="Case is already resolved")
-    
-    case.status = "resolved"
-    case.resolutionReason = update.resolutionReason
-    case.resolvedBy = current_user.userID
-    case.resolutionTimestamp = datetime.now()
+    def resolve() -> TriageCasePublic:
+        case = db.get(TriageCase, id)
+        if not case:
+            raise HTTPException(status_code=404, detail="Triage case not found")
+        
+        if case.status == "resolved":
+          raise HTTPException(status_code=400, detail="Case is already resolved")
+        
+        case.status = "resolved"
+        case.resolutionReason = update.resolutionReason
+        case.resolvedBy = current_user.userID
+        case.resolutionTimestamp = datetime.now()
 
-    db.add(case)
-    db.commit()
-    db.refresh(case)
-    
-    return build_case_public(case, db)
\ No newline at end of file
+        db.add(case)
+        db.commit()
+        db.refresh(case)
+        
+        return build_case_public(case, db)
+
+    return run_idempotent(
+        idempotency_key,
+        f"resolve-case:{current_user.userID}:{id}",
+        fingerprint(update),
+        response,
+        resolve,
+    )
\ No newline at end of file
@@ -0,0 +1,56 @@
+# app/server.py
+import logging
+import math
+import os
+import uvicorn
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Postgres connections one worker can hold: its pool, overflow and the readiness probe
+CONNECTIONS_PER_WORKER = settings.DB_POOL_SIZE + settings.DB_MAX_OVERFLOW + 1
+
+def available_cpus() -> int:
+    """CPUs this process may use, honouring a cgroup v2 CPU quota when one is set"""
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cpus = os.cpu_count() or 1
+    try:
+        with open("/sys/fs/cgroup/cpu.max") as f:
+            quota, period = f.read().split()
+        if quota != "max":
+            cpus = min(cpus, max(1, math.ceil(int(quota) / int(period))))
+    except (OSError, ValueError):
+        pass
+    return cpus
+
+def worker_count() -> int:
+    """WEB_CONCURRENCY if set, otherwise one worker per CPU capped by the DB connection budget.
+
+    Every worker is a separate process with its own engine, Redis pool, admission
+    limits and metrics, so DB_POOL_SIZE, DB_MAX_OVERFLOW, ADMISSION_MAX_CONCURRENCY
+    and the /metrics counters all multiply by the number of workers.
+    """
+    if settings.WEB_CONCURRENCY > 0:
+        return settings.WEB_CONCURRENCY
+    return max(1, min(available_cpus(), settings.DB_MAX_CONNECTIONS // CONNECTIONS_PER_WORKER))
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO)
+    workers = worker_count()
+    logger.info(
+        f"Starting {workers} worker(s), up to {workers * CONNECTIONS_PER_WORKER} "
+        f"of DB_MAX_CONNECTIONS={settings.DB_MAX_CONNECTIONS} Postgres connections"
+    )
+    uvicorn.run(
+        "app.main:app",
+        host="0.0.0.0",
+        port=8000,
+        workers=workers,
+        timeout_graceful_shutdown=settings.GRACEFUL_SHUTDOWN_SECONDS,
+        proxy_headers=True,
+    )
+
+if __name__ == "__main__":
+    main()
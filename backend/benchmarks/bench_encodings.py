@@ -0,0 +1,94 @@
+"""Bytes on the wire and CPU cost per response encoding.
+
+Builds a synthetic GET /triage-cases/ payload (long transcripts and summaries,
+like the phone agent produces) and times every encoding the API can negotiate.
+
+Run from backend/:  python -m benchmarks.bench_encodings [--cases 100] [--rounds 20]
+"""
+import argparse
+import json
+import random
+import time
+import uuid
+from datetime import datetime, timezone
+
+from app.core.compression import ENCODERS, _json_to_msgpack
+
+WORDS = (
+    "patient reports ear pain left side two weeks fever sore throat hearing loss "
+    "tinnitus dizziness sinus pressure congestion drainage mild severe worsening "
+    "since last visit no prior surgery allergic to penicillin requests callback"
+).split()
+
+
+def _text(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+
+def build_payload(n_cases: int, seed: int = 0) -> bytes:
+    rng = random.Random(seed)
+    cases = [
+        {
+            "caseID": str(uuid.UUID(int=rng.getrandbits(128))),
+            "patientID": str(uuid.UUID(int=rng.getrandbits(128))),
+            "transcript": _text(rng, 600),
+            "AIConfidence": rng.random(),
+            "AISummary": _text(rng, 80),
+            "status": rng.choice(["pending", "resolved"]),
+            "AIUrgency": rng.choice(["low", "medium", "high"]),
+            "clinicianSummary": _text(rng, 60),
+            "overrideSummary": None,
+            "overrideUrgency": None,
+            "firstName": "Jane",
+            "lastName": "Doe",
+            "DOB": "1980-01-01",
+            "contactInfo": "555-0100",
+            "insuranceInfo": None,
+            "returningPatient": rng.random() < 0.5,
+            "languagePreference": "en",
+            "verified": True,
+            "dateCreated": datetime.now(timezone.utc).isoformat(),
+            "createdBy": None,
+            "resolutionReason": None,
+            "resolutionTimestamp": None,
+            "resolvedBy": None,
+            "resolvedByEmail": None,
+        }
+        for _ in range(n_cases)
+    ]
+    return json.dumps({"cases": cases, "count": n_cases}, separators=(",", ":")).encode()
+
+
+def _time(func, body: bytes, rounds: int) -> tuple[bytes, float]:
+    out = func(body)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        func(body)
+    return out, (time.perf_counter() - start) / rounds * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cases", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    body = build_payload(args.cases)
+    packed = _json_to_msgpack(body)
+
+    rows = [("json", "identity", len(body), 0.0)]
+    _, ms = _time(_json_to_msgpack, body, args.rounds)
+    rows.append(("msgpack", "identity", len(packed), ms))
+    for fmt, payload, base_ms in (("json", body, 0.0), ("msgpack", packed, ms)):
+        for name, encoder in ENCODERS.items():
+            out, enc_ms = _time(encoder, payload, args.rounds)
+            rows.append((fmt, name, len(out), base_ms + enc_ms))
+
+    print(f"{args.cases} cases, {len(body):,} bytes of JSON, mean of {args.rounds} rounds")
+    print(f"{'format':<8} {'encoding':<9} {'bytes':>10} {'ratio':>7} {'ms':>8}")
+    for fmt, name, size, ms in rows:
+        print(f"{fmt:<8} {name:<9} {size:>10,} {size / len(body):>7.1%} {ms:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
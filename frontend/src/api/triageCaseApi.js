@@ -11,6 +11,11 @@ class TriageCaseApi {
     return res.data;
   }
 
+  async getCasesByIds(ids) {
+    const res = await apiClient.post('/triage-cases/batch', { caseIDs: ids });
+    return res.data;
+  }
+
   async createCase(caseData) {
     const res = apiClient.post('/triage-cases', caseData);
     return res.data;